@@ -5,19 +5,15 @@ This saves a lot of memory.
 """
 from collections import namedtuple
 
-from dbfread22 import DBF
+from dbfread2 import DBF
 
-table = DBF('files/people.dbf', lowernames=True)
+table = DBF('files/people.dbf', lowercase_names=True)
 
 # Set record factory. This must be done after
 # the table is opened because it needs the field
-# names.
-Record = namedtuple('Record', table.field_names)
-
-def factory(lst):
-    return Record(**dict(lst))
-
-table.recfactory = factory
+# names. Named tuples are built directly from the
+# field values.
+table.recfactory = namedtuple('Record', table.field_names)
 
 for record in table:
     print(record.name)
@@ -0,0 +1,212 @@
+"""
+Parser that converts whole DBF columns to NumPy arrays.
+
+Each column is parsed with a handful of vectorized NumPy operations
+instead of one Python call per value. Field types without a vectorized
+parser fall back to the table's field parser and are returned as object
+arrays.
+
+Requires NumPy.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from .field_parser import _NUMERIC_PADDING, FieldParser
+
+
+class ArrayParser:
+    """Parse DBF columns into NumPy arrays."""
+
+    def __init__(self, table: Any, memofile: Any | None = None) -> None:
+        self.table = table
+        self.dbversion = table.header.dbversion
+        self.field_parser = table.parserclass(table, memofile)
+
+    def _vector_parser(self, field: Any) -> Callable | None:
+        """Return the column parser for a field or None.
+
+        Columns are only parsed in bulk if the table's parser class
+        does not override how that field type is parsed.
+        """
+        if self.table.raw:
+            return None
+
+        parser_class = type(self.field_parser)
+        if parser_class.parse is not FieldParser.parse:
+            return None
+
+        if field.type.isalnum():
+            name = 'parse' + field.type
+        else:
+            # Hexadecimal ASCII code, same as FieldParser.
+            # Example: parse2B() ('+' field)
+            name = f'parse{ord(field.type):02X}'
+
+        func = getattr(self, name, None)
+        if func is None:
+            return None
+        elif (field.type in 'CV'
+              and parser_class.decode_text is not FieldParser.decode_text):
+            # Text columns are decoded with decode_text().
+            return None
+        elif getattr(parser_class, name, None) is not getattr(FieldParser,
+                                                              name, None):
+            return None
+        else:
+            return func
+
+    def parse_records(self, data: Any,
+                      record_type: bytes = b' ') -> dict[str, np.ndarray]:
+        """Parse records of a given type and return a dict of arrays.
+
+        data is the content of the DBF file as a bytes-like object.
+        """
+        header = self.table.header
+        numrecords = max(len(data) - header.headerlen, 0) // header.recordlen
+
+        rows = np.frombuffer(data, dtype=np.uint8,
+                             count=numrecords * header.recordlen,
+                             offset=header.headerlen)
+        rows = rows.reshape(numrecords, header.recordlen)
+
+        # Drop everything from the end of file marker on.
+        eof = np.flatnonzero(rows[:, 0] == 0x1a)
+        if eof.size:
+            rows = rows[:eof[0]]
+
+        # Boolean indexing makes a copy, so rows no longer refers to data.
+        rows = rows[rows[:, 0] == record_type[0]]
+
+        arrays = {}
+        for field, offset, length in zip(self.table.fields,
+                                         self.table._field_offsets,
+                                         self.table._field_lengths,
+                                         strict=True):
+            column = np.ascontiguousarray(rows[:, offset:offset + length])
+
+            func = self._vector_parser(field)
+            if func is None:
+                arrays[field.name] = self._parse_values(field, column)
+            else:
+                arrays[field.name] = func(field, column)
+
+        return arrays
+
+    def _parse_values(self, field: Any, column: np.ndarray) -> np.ndarray:
+        """Parse a column one value at a time with the field parser."""
+        if self.table.raw:
+            def parse(_, data):
+                return data
+        else:
+            parse = self.field_parser.parse
+
+        data = column.tobytes()
+        length = field.length
+        values = np.empty(len(column), dtype=object)
+        for i, pos in enumerate(range(0, len(data), length)):
+            values[i] = parse(field, data[pos:pos + length])
+        return values
+
+    def _strings(self, column: np.ndarray) -> np.ndarray:
+        """View a column as an array of byte strings."""
+        return column.view(f'S{column.shape[1]}').reshape(-1)
+
+    def parseC(self, field: Any, column: np.ndarray) -> np.ndarray:
+        """Parse char column and return array of unicode strings"""
+        strings = np.char.rstrip(self._strings(column), b'\0 ')
+        # Read from the field parser since a subclass may change them.
+        return np.char.decode(strings, self.field_parser.encoding,
+                              self.field_parser.char_decode_errors)
+
+    def parseD(self, field: Any, column: np.ndarray) -> np.ndarray:
+        """Parse date column and return array of datetime64[D]
+
+        Empty dates are returned as NaT.
+        """
+        dates = np.full(len(column), np.datetime64('NaT', 'D'))
+
+        if column.shape[1] == 8:
+            # Compute year, month and day from the YYYYMMDD digits.
+            digits = column.astype(np.int64) - ord('0')
+            year = digits[:, :4] @ np.array([1000, 100, 10, 1])
+            month = digits[:, 4:6] @ np.array([10, 1])
+            day = digits[:, 6:8] @ np.array([10, 1])
+
+            ok = (((digits >= 0) & (digits <= 9)).all(axis=1)
+                  & (year >= 1)
+                  & (month >= 1) & (month <= 12)
+                  & (day >= 1) & (day <= 31))
+
+            rows = np.flatnonzero(ok)
+            months = ((year[rows] - 1970).astype('datetime64[Y]')
+                      + (month[rows] - 1).astype('timedelta64[M]'))
+            days = months.astype('datetime64[D]')
+            days += (day[rows] - 1).astype('timedelta64[D]')
+            dates[rows] = days
+
+            # Days past the end of the month (like 20230230) roll over
+            # into the next month. Leave those to the field parser.
+            ok[rows[days.astype('datetime64[M]') != months]] = False
+        else:
+            ok = np.zeros(len(column), dtype=bool)
+
+        # Blank, zero and unusual dates are handled by the field parser.
+        data = column.tobytes()
+        length = column.shape[1]
+        parse = self.field_parser.parse
+        for i in np.flatnonzero(~ok):
+            value = parse(field, data[i * length:(i + 1) * length])
+            if value is not None:
+                dates[i] = np.datetime64(value, 'D')
+
+        return dates
+
+    def parseF(self, field: Any, column: np.ndarray) -> np.ndarray:
+        """Parse float column and return array of floats
+
+        Empty values are returned as NaN.
+        """
+        strings = np.char.strip(self._strings(column), _NUMERIC_PADDING)
+        strings = np.where(strings == b'', b'nan', strings)
+        return strings.astype(np.float64)
+
+    def parseI(self, field: Any, column: np.ndarray) -> np.ndarray:
+        """Parse integer or autoincrement column and return array of ints"""
+        return column.view('<i4').reshape(-1)
+
+    def parseN(self, field: Any, column: np.ndarray) -> np.ndarray:
+        """Parse numeric column (N)
+
+        Returns an array of ints if all values are integers, otherwise
+        an array of floats with NaN for empty values.
+        """
+        strings = np.char.strip(self._strings(column), _NUMERIC_PADDING)
+        empty = strings == b''
+
+        if not empty.any():
+            try:
+                return strings.astype(np.int64)
+            except (ValueError, OverflowError):
+                pass
+
+        # Account for , in numeric fields
+        strings = np.char.replace(strings, b',', b'.')
+        strings = np.where(empty, b'nan', strings)
+        return strings.astype(np.float64)
+
+    def parseO(self, field: Any, column: np.ndarray) -> np.ndarray:
+        """Parse long column (O) and return array of floats"""
+        return column.view('<f8').reshape(-1)
+
+    # Autoincrement field ('+')
+    parse2B = parseI
+
+    # Varchar field ('V') (Visual FoxPro)
+    parseV = parseC
+
+
+__all__ = ['ArrayParser']
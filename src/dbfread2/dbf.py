@@ -1,9 +1,16 @@
 """
 Class to read DBF files.
 """
-from collections.abc import Callable
+import mmap
+import multiprocessing
+import struct
+from array import array
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
-from os import PathLike
+from functools import cache
+from itertools import accumulate
+from os import PathLike, cpu_count
 from pathlib import Path
 from typing import Any, BinaryIO, Union
 
@@ -53,6 +60,9 @@ DBFField = StructParser(
      'index_field_flag',
      ])
 
+# Field types that store their data in the memo file.
+MEMO_FIELD_TYPES = frozenset('MGPB')
+
 
 def expand_year(year: int) -> int:
     """Convert 2-digit year to 4-digit year."""
@@ -62,6 +72,67 @@ def expand_year(year: int) -> int:
         return 1900 + year
 
 
+def _is_namedtuple_class(obj: Any) -> bool:
+    """Return True if obj is a named tuple class."""
+    return (isinstance(obj, type)
+            and issubclass(obj, tuple)
+            and hasattr(obj, '_make'))
+
+
+def _parse_record_range(table_args: dict[str, Any], record_type: bytes,
+                        start: int, stop: int) -> list[list[tuple[str, Any]]]:
+    """Parse records start to stop of a table.
+
+    This runs in a worker process for DBF.parallel_iter(). The table is
+    opened again from table_args so no file data is sent between
+    processes. Records are returned as lists of (name, value) items,
+    which keeps all fields even if names are repeated.
+    """
+    table = DBF(**table_args)
+    return list(table._iter_records(record_type, start, stop))
+
+
+@cache
+def _compile_record_parser(numfields: int, as_dict: bool) -> Callable:
+    """Generate code for parsing records with numfields fields.
+
+    Returns a function make(split, fields, parsers, names) which
+    returns a record parser. The record parser is called with the file
+    data and the offset of a record and returns the list of parsed
+    values (or a dict if as_dict is true).
+
+    The generated code calls each field parser in turn instead of
+    looping over the fields. Field names and other data from the file
+    are passed in as variables and never become part of the code, so
+    the code only depends on the number of fields and can be shared
+    between tables.
+    """
+    indices = range(numfields)
+    fields = ''.join(f'f{i}, ' for i in indices)
+    parsers = ''.join(f'p{i}, ' for i in indices)
+    names = ''.join(f'n{i}, ' for i in indices)
+    data = ''.join(f'd{i}, ' for i in indices)
+    if as_dict:
+        values = '{' + ''.join(f'n{i}: p{i}(f{i}, d{i}), ' for i in indices) + '}'
+    else:
+        values = '[' + ''.join(f'p{i}(f{i}, d{i}), ' for i in indices) + ']'
+
+    source = (
+        'def make(split, fields, parsers, names):\n'
+        f'    [{fields}] = fields\n'
+        f'    [{parsers}] = parsers\n'
+        f'    [{names}] = names\n'
+        '    def parse_record(data, pos):\n'
+        f'        [{data}] = split(data, pos)\n'
+        f'        return {values}\n'
+        '    return parse_record\n'
+    )
+
+    namespace: dict[str, Any] = {}
+    exec(compile(source, f'<record parser {numfields}>', 'exec'), namespace)
+    return namespace['make']
+
+
 class RecordIterator:
     """Iterator for DBF records."""
 
@@ -100,7 +171,8 @@ class DBF:
             ignore_case: Whether to ignore case in filename matching
             lowercase_names: Convert field names to lowercase
             parser_class: Class to use for parsing fields
-            record_factory: Callable to create record objects (default: dict)
+            record_factory: Callable to create record objects (default: dict).
+                A named tuple class is given the values in field order.
             preload: Whether to load all records into memory immediately
             keep_raw: Return raw bytes instead of parsed values
             ignore_missing_memo: Don't raise error if memo file is missing
@@ -115,7 +187,7 @@ class DBF:
         self.char_decode_errors = char_decode_errors
 
         if record_factory is None:
-            self.recfactory = lambda items: dict(items)
+            self.recfactory = dict
         else:
             self.recfactory = record_factory
 
@@ -138,6 +210,11 @@ class DBF:
         self.header: Any = None  # DBFHeader instance
         self.fields: list[Any] = []  # list of DBFField instances
         self.field_names: list[str] = []  # list of field names
+        # Record layout as parallel arrays, one item per field.
+        self._field_offsets: array[int] = array('i')
+        self._field_lengths: array[int] = array('i')
+        # Splits a record into raw field values.
+        self._record_struct = struct.Struct('')
         self.date: date | None = None
 
         with open(self.filename, mode='rb') as infile:
@@ -166,8 +243,7 @@ class DBF:
     def _get_memofilename(self) -> str | None:
         """Get the memo filename if it exists."""
         # Does the table have a memo field?
-        field_types = [field.type for field in self.fields]
-        if not set(field_types) & set('MGPB'):
+        if not any(field.type in MEMO_FIELD_TYPES for field in self.fields):
             # No memo fields.
             return None
 
@@ -224,6 +300,89 @@ class DBF:
         else:
             return RecordIterator(self, b'*')
 
+    def to_arrays(self) -> dict[str, Any]:
+        """Return records as a dict of NumPy arrays, one per field.
+
+        Columns are parsed in bulk instead of record by record, which
+        makes this much faster than iterating over the table for large
+        files. The result can be passed directly to
+        ``pandas.DataFrame()``. Deleted records are not included.
+
+        Requires NumPy.
+        """
+        # NumPy is an optional dependency.
+        from .array_parser import ArrayParser
+
+        with self._open_memofile() as memofile, \
+             self._map_file() as mapped:
+            parser = ArrayParser(self, memofile)
+            return parser.parse_records(mapped)
+
+    def parallel_iter(self, workers: int | None = None) -> Iterator[Any]:
+        """Iterate over records, parsing them in worker processes.
+
+        Records are split into one range per worker and each worker
+        opens the file and parses its range on its own. The records are
+        returned in the same order as when iterating over the table.
+        This is only worth it for very large tables.
+
+        workers is the number of processes to use (default: number of
+        CPUs). The parser class must be importable by the workers, and
+        as with all use of multiprocessing the main module must be safe
+        to import.
+        """
+        if self.loaded:
+            return iter(self._records)
+
+        if workers is None:
+            workers = cpu_count() or 1
+        elif workers < 1:
+            raise ValueError(f'workers must be at least 1 (was {workers})')
+
+        return self._iter_parallel(workers)
+
+    def _iter_parallel(self, workers: int) -> Iterator[Any]:
+        """Iterate over records parsed by worker processes."""
+        numrecords = len(self._read_separators())
+        chunksize = max(-(-numrecords // workers), 1)
+        ranges = range(0, numrecords, chunksize)
+
+        table_args = {
+            'filepath': self.filename,
+            'encoding': self.encoding,
+            'ignore_case': False,
+            'lowercase_names': self.lowernames,
+            'parser_class': self.parserclass,
+            'keep_raw': self.raw,
+            'ignore_missing_memo': self.ignore_missing_memofile,
+            'char_decode_errors': self.char_decode_errors,
+            'record_factory': list,
+        }
+
+        # The workers return lists of items which are converted here
+        # since the record factory may not be picklable.
+        recfactory = self.recfactory
+        make_tuple = _is_namedtuple_class(recfactory)
+
+        # Workers are spawned rather than forked, which is not safe if
+        # the calling process has threads.
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=context) as executor:
+            chunks = executor.map(_parse_record_range,
+                                  [table_args] * len(ranges),
+                                  [b' '] * len(ranges),
+                                  ranges,
+                                  [start + chunksize for start in ranges])
+            for records in chunks:
+                for items in records:
+                    if recfactory is dict:
+                        yield dict(items)
+                    elif make_tuple:
+                        yield recfactory._make([value for _, value in items])
+                    else:
+                        yield recfactory(items)
+
     def _read_header(self, infile: BinaryIO) -> None:
         """Read the DBF header."""
         self.header = DBFHeader.read(infile)
@@ -264,6 +423,16 @@ class DBF:
             self.field_names.append(field.name)
             self.fields.append(field)
 
+        # Offset of each field from the start of the record. The first
+        # byte of the record is the separator (deletion flag).
+        self._field_lengths = array('i', [field.length
+                                          for field in self.fields])
+        self._field_offsets = array('i', accumulate(self._field_lengths,
+                                                    initial=1))[:-1]
+        # Skip the separator and read each field as a byte string.
+        self._record_struct = struct.Struct('<x' + ''.join(
+            f'{length}s' for length in self._field_lengths))
+
     def _open_memofile(self) -> Any:
         """Open the memo file if it exists."""
         if self.memofilename and not self.raw:
@@ -287,66 +456,101 @@ class DBF:
             elif not field_parser.field_type_supported(field.type):
                 raise ValueError(f'Unknown field type: {field.type!r}')
 
-    def _skip_record(self, infile) -> None:
-        """Skip a record in the DBF file."""
-        # -1 for the record separator which was already read.
-        infile.seek(self.header.recordlen - 1, 1)
+    def _map_file(self) -> mmap.mmap:
+        """Memory map the DBF file for reading.
+
+        The whole file is mapped at once so records can be read
+        without a system call per field.
+        """
+        with open(self.filename, 'rb') as infile:
+            mapped = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Records are read from start to end, so let the OS read ahead
+        # aggressively. Not available on all platforms.
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+        return mapped
+
+    def _record_offsets(self, mapped: mmap.mmap) -> range:
+        """Return the file offset of each record.
+
+        A truncated record at the end of the file is ignored.
+        """
+        recordlen = self.header.recordlen
+        return range(self.header.headerlen, len(mapped) - recordlen + 1,
+                     recordlen)
+
+    def _read_separators(self) -> bytes:
+        """Return the separator (first byte) of every record.
+
+        Records after the end of file marker are not included.
+        """
+        with self._map_file() as mapped:
+            offsets = self._record_offsets(mapped)
+            # Collect the separator of every record with one slice.
+            separators = mapped[offsets.start:offsets.stop:offsets.step]
+
+        end_of_records = separators.find(b'\x1a')
+        if end_of_records != -1:
+            separators = separators[:end_of_records]
+
+        return separators
 
     def _count_records(self, record_type: bytes = b' ') -> int:
         """Count the number of records of a given type."""
-        count = 0
+        return self._read_separators().count(record_type)
 
-        with open(self.filename, 'rb') as infile:
-            # Skip to first record.
-            infile.seek(self.header.headerlen, 0)
-
-            while True:
-                sep = infile.read(1)
-                if sep == record_type:
-                    count += 1
-                    self._skip_record(infile)
-                elif sep in (b'\x1a', b''):
-                    # End of records.
-                    break
-                else:
-                    self._skip_record(infile)
-
-        return count
+    def _iter_records(self, record_type: bytes = b' ', start: int = 0,
+                      stop: int | None = None) -> Any:
+        """Iterate over records of a given type.
 
-    def _iter_records(self, record_type: bytes = b' ') -> Any:
-        """Iterate over records of a given type."""
-        with open(self.filename, 'rb') as infile, \
+        Only records start to stop are read. These are record numbers
+        in the file, counting records of all types.
+        """
+        with self._map_file() as mapped, \
              self._open_memofile() as memofile:
 
-            # Skip to first record.
-            infile.seek(self.header.headerlen, 0)
+            # Shortcuts for speed.
+            recfactory = self.recfactory
+            # Build dicts and named tuples directly from the values
+            # instead of via a list of items.
+            make_dict = recfactory is dict
+            make_tuple = _is_namedtuple_class(recfactory)
+            marker = record_type[0]
+            names = tuple(self.field_names)
+            split = self._record_struct.unpack_from
 
             if self.raw:
-                def parse(_, data):
-                    return data
+                # Raw values are returned as split out of the record.
+                parse_record = split
+                parsed_dict = False
             else:
                 field_parser = self.parserclass(self, memofile)
-                parse = field_parser.parse
-
-            # Shortcuts for speed.
-            skip_record = self._skip_record
-            read = infile.read
-
-            while True:
-                sep = read(1)
-
-                if sep == record_type:
-                    items = [
-                        (field.name, parse(field, read(field.length)))
-                        for field in self.fields
-                    ]
-                    yield self.recfactory(items)
-
-                elif sep in (b'\x1a', b''):
+                make = _compile_record_parser(len(self.fields), make_dict)
+                parse_record = make(split, self.fields,
+                                    field_parser.get_parsers(self.fields),
+                                    names)
+                parsed_dict = make_dict
+
+            for pos in self._record_offsets(mapped)[start:stop]:
+                sep = mapped[pos]
+
+                if sep == marker:
+                    values = parse_record(mapped, pos)
+
+                    if parsed_dict:
+                        yield values
+                    elif make_dict:
+                        yield dict(zip(names, values, strict=False))
+                    elif make_tuple:
+                        yield recfactory._make(values)
+                    else:
+                        yield recfactory(list(zip(names, values, strict=False)))
+
+                elif sep == 0x1a:
                     # End of records.
                     break
-                else:
-                    skip_record(infile)
 
     def __iter__(self) -> Any:
         """Iterate over all records."""
@@ -7,10 +7,29 @@ import datetime
 import struct
 from collections.abc import Callable
 from decimal import Decimal
-from typing import Any
+from typing import Any, ClassVar
 
 from .memo import BinaryMemo
 
+# Precompiled structs for binary field types.
+_INT32 = struct.Struct('<i')
+_UINT32 = struct.Struct('<I')
+_INT64 = struct.Struct('<q')
+_DOUBLE = struct.Struct('<d')
+_JULIAN_DAY_MSEC = struct.Struct('<LL')
+
+# Characters stripped from numeric fields. This is the same whitespace
+# as bytes.strip() but in some files * and \0 are used for padding.
+_NUMERIC_PADDING = b' \t\n\r\x0b\x0c*\0'
+
+# Values of logical fields. Byte values are included as keys so a
+# single byte given as an int is handled the same as before.
+_LOGICAL_VALUES: dict[bytes | int, bool | None] = {}
+for _chars, _value in [(b'TtYy', True), (b'FfNn', False), (b'? \0', None)]:
+    for _char in _chars:
+        _LOGICAL_VALUES[_char] = _LOGICAL_VALUES[bytes([_char])] = _value
+del _chars, _value, _char
+
 
 class InvalidValue(bytes):
     def __repr__(self) -> str:
@@ -19,6 +38,9 @@ class InvalidValue(bytes):
 
 
 class FieldParser:
+    # Field type to parse method name, set for each class.
+    _parser_names: ClassVar[dict[str, str]]
+
     def __init__(self, table: Any, memofile: Any | None = None) -> None:
         """Create a new field parser
 
@@ -37,22 +59,36 @@ class FieldParser:
     def decode_text(self, text: bytes) -> str:
         return str(text, self.encoding, errors=self.char_decode_errors)
 
-    def _create_lookup_table(self) -> dict[str, Callable]:
-        """Create a lookup table for field types."""
-        lookup: dict[str, Callable] = {}
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._parser_names = cls._find_parser_names()
+
+    @classmethod
+    def _find_parser_names(cls) -> dict[str, str]:
+        """Map field types to the names of their parse methods."""
+        names: dict[str, str] = {}
 
-        for name in dir(self):
+        for name in dir(cls):
             if name.startswith('parse'):
                 field_type = name[5:]
                 if len(field_type) == 1:
-                    lookup[field_type] = getattr(self, name)
+                    names[field_type] = name
                 elif len(field_type) == 2:
                     # Hexadecimal ASCII code for field name.
                     # Example: parse2B() ('+' field)
                     field_type = chr(int(field_type, 16))
-                    lookup[field_type] = getattr(self, name)
+                    names[field_type] = name
 
-        return lookup
+        return names
+
+    def _create_lookup_table(self) -> dict[str, Callable]:
+        """Create a lookup table for field types.
+
+        The method names are found once per class, so this only has
+        to bind them.
+        """
+        return {field_type: getattr(self, name)
+                for field_type, name in self._parser_names.items()}
 
     def field_type_supported(self, field_type: str) -> bool:
         """Checks if the field_type is supported by the parser
@@ -62,6 +98,24 @@ class FieldParser:
         """
         return field_type in self._lookup
 
+    def get_parsers(self, fields: list[Any]) -> tuple[Callable, ...]:
+        """Return a parse function for each of the fields.
+
+        This does the field type lookup once per field instead of once
+        per value. The functions take the same arguments as parse(). If
+        a subclass overrides parse() it is returned for every field.
+        """
+        if type(self).parse is not FieldParser.parse:
+            return tuple(self.parse for _ in fields)
+
+        parsers = []
+        for field in fields:
+            try:
+                parsers.append(self._lookup[field.type])
+            except KeyError as e:
+                raise ValueError(f'Unknown field type: {field.type!r}') from e
+        return tuple(parsers)
+
     def parse(self, field: Any, data: bytes) -> Any:
         """Parse field and return value"""
         try:
@@ -82,7 +136,14 @@ class FieldParser:
     def parseD(self, field: Any, data: bytes) -> datetime.date | None:
         """Parse date field and return datetime.date or None"""
         try:
-            return datetime.date(int(data[:4]), int(data[4:6]), int(data[6:8]))
+            if len(data) == 8 and data.isdigit():
+                # Convert YYYYMMDD with a single int() call.
+                value = int(data)
+                return datetime.date(value // 10000, value // 100 % 100,
+                                     value % 100)
+            else:
+                return datetime.date(int(data[:4]), int(data[4:6]),
+                                     int(data[6:8]))
         except ValueError as e:
             if data.strip(b' 0\0') == b'':
                 # A record containing only spaces and/or zeros is
@@ -93,8 +154,7 @@ class FieldParser:
 
     def parseF(self, field: Any, data: bytes) -> float | None:
         """Parse float field and return float or None"""
-        # In some files * is used for padding.
-        data = data.strip().strip(b'*')
+        data = data.strip(_NUMERIC_PADDING)
 
         if data:
             return float(data)
@@ -103,23 +163,19 @@ class FieldParser:
 
     def parseI(self, field: Any, data: bytes) -> int:
         """Parse integer or autoincrement field and return int."""
-        return struct.unpack('<i', data)[0]
+        return _INT32.unpack_from(data)[0]
 
     def parseL(self, field: Any, data: bytes) -> bool | None:
         """Parse logical field and return True, False or None"""
-        if data in b'TtYy':
-            return True
-        elif data in b'FfNn':
-            return False
-        elif data in b'? \0':
-            return None
-        else:
+        try:
+            return _LOGICAL_VALUES[data]
+        except KeyError:
             message = 'Illegal value for logical field: {!r}'
-            raise ValueError(message.format(data))
+            raise ValueError(message.format(data)) from None
 
     def _parse_memo_index(self, data: bytes) -> int:
         if len(data) == 4:
-            return struct.unpack('<I', data)[0]
+            return _UINT32.unpack_from(data)[0]
         else:
             try:
                 return int(data)
@@ -151,21 +207,19 @@ class FieldParser:
 
         Returns int, float or None if the field is empty.
         """
-        # In some files * is used for padding.
-        data = data.strip().strip(b'*\0')
+        data = data.strip(_NUMERIC_PADDING)
+        if not data:
+            return None
 
         try:
             return int(data)
         except ValueError:
-            if not data.strip():
-                return None
-            else:
-                # Account for , in numeric fields
-                return float(data.replace(b',', b'.'))
+            # Account for , in numeric fields
+            return float(data.replace(b',', b'.'))
 
     def parseO(self, field: Any, data: bytes) -> float:
         """Parse long field (O) and return float."""
-        return struct.unpack('d', data)[0]
+        return _DOUBLE.unpack_from(data)[0]
 
     def parseT(self, field: Any, data: bytes) -> datetime.datetime | None:
         """Parse time field (T)
@@ -191,7 +245,7 @@ class FieldParser:
             # I've seen data where the day number is 0 and
             # msec is 2 or 4. I think we can safely return None for those.
             # (At least I hope so.)
-            day, msec = struct.unpack('<LL', data)
+            day, msec = _JULIAN_DAY_MSEC.unpack_from(data)
             if day:
                 dt = datetime.datetime.fromordinal(day - offset)
                 delta = datetime.timedelta(seconds=msec / 1000)
@@ -206,7 +260,7 @@ class FieldParser:
 
         The field is encoded as a 8-byte little endian integer
         with 4 digits of precision."""
-        value = struct.unpack('<q', data)[0]
+        value = _INT64.unpack_from(data)[0]
 
         # Currency fields are stored with 4 points of precision
         return Decimal(value) / 10000
@@ -219,7 +273,7 @@ class FieldParser:
         point number (8 bytes).
         """
         if self.dbversion in [0x30, 0x31, 0x32]:
-            return struct.unpack('d', data)[0]
+            return _DOUBLE.unpack_from(data)[0]
         else:
             return self.get_memo(self._parse_memo_index(data))
 
@@ -243,3 +297,6 @@ class FieldParser:
 
     # Varchar field ('V') (Visual FoxPro)
     parseV = parseC
+
+
+FieldParser._parser_names = FieldParser._find_parser_names()
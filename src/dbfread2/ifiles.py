@@ -13,12 +13,39 @@ Todo:
 import fnmatch
 import glob
 import os
+import re
 from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
 PathLike = Union[str, Path]
 
+
+class _CaseTable(dict[int, str]):
+    """Table for str.translate() that maps letters to '[Xx]'.
+
+    Entries are added the first time a character is seen.
+    """
+
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        upper = char.upper()
+        lower = char.lower()
+        if char.isalpha() and upper != lower:
+            value = f'[{upper}{lower}]'
+        else:
+            value = char
+        self[code] = value
+        return value
+
+
+_CASE_TABLE = _CaseTable()
+
+# Characters that make a glob pattern match more than one name.
+_MAGIC_CHARS = re.compile('[*?[]')
+
+
 def ipat(pat: PathLike) -> str:
     """Convert glob pattern to case insensitive form.
     
@@ -32,21 +59,17 @@ def ipat(pat: PathLike) -> str:
         >>> ipat('test.dbf')
         '[Tt][Ee][Ss][Tt].[Dd][Bb][Ff]'
     """
-    pat = str(pat)  # Convert Path to str if needed
+    # Convert Path to str if needed, so the result can be cached.
+    return _ipat(str(pat))
+
+
+@lru_cache(maxsize=1024)
+def _ipat(pat: str) -> str:
+    """Convert glob pattern to case insensitive form (cached)."""
     dirname, basename = os.path.split(pat)
 
     # Convert '/path/to/test.fpt' => '/path/to/[Tt][Ee][Ss][Tt].[Ff][Pp][Tt]'
-    newpat = ''
-    for char in basename:
-        if char.isalpha():
-            upper = char.upper()
-            lower = char.lower()
-            if upper != lower:
-                newpat += f'[{upper}{lower}]'
-            else:
-                newpat += char
-        else:
-            newpat += char
+    newpat = basename.translate(_CASE_TABLE)
 
     return str(Path(dirname) / newpat if dirname else newpat)
 
@@ -61,7 +84,15 @@ def ifnmatch(name: PathLike, pat: PathLike) -> bool:
     Returns:
         True if the name matches the pattern, False otherwise
     """
-    return fnmatch.fnmatch(str(name), ipat(str(pat)))
+    # Same as fnmatch.fnmatch() but with the pattern compiled once.
+    return _ipat_regex(os.path.normcase(str(pat))).match(
+        os.path.normcase(str(name))) is not None
+
+
+@lru_cache(maxsize=256)
+def _ipat_regex(pat: str) -> re.Pattern[str]:
+    """Compile case insensitive glob pattern to a regular expression."""
+    return re.compile(fnmatch.translate(_ipat(pat)))
 
 
 def iglob(pat: PathLike) -> Iterator[str]:
@@ -94,10 +125,26 @@ def ifind(pat: PathLike, ext: str | None = None) -> str | None:
     """
     pat = str(pat)
     if ext:
-        pat = str(Path(pat).with_suffix(ext))
+        pat = os.path.splitext(pat)[0] + ext
 
-    files = list(iglob(pat))
-    return files[0] if files else None
+    if _MAGIC_CHARS.search(pat):
+        files = list(iglob(pat))
+        return files[0] if files else None
+
+    # A plain file name only needs one pass over the directory.
+    dirname, basename = os.path.split(pat)
+    target = basename.lower()
+    try:
+        with os.scandir(dirname or '.') as entries:
+            for entry in entries:
+                if entry.name.lower() == target:
+                    # Same form of the name as glob would return.
+                    return str(Path(dirname) / entry.name) if dirname else entry.name
+    except OSError:
+        # Missing or unreadable directory.
+        pass
+
+    return None
 
 
 __all__ = ['ifind', 'ifnmatch', 'iglob', 'ipat']
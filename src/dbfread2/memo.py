@@ -10,8 +10,11 @@ DB4 == dBase IV
 """
 from __future__ import annotations
 
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO
 
 from .ifiles import ifind
 from .struct_parser import StructParser
@@ -30,12 +33,17 @@ VFPMemoHeader = StructParser(
     ['type',
      'length'])
 
+_unpack_vfp_memo_header = VFPMemoHeader.struct.unpack_from
+
 DB4MemoHeader = StructParser(
     'DBase4MemoHeader',
     '<LL',
     ['reserved',  # Always 0xff 0xff 0x08 0x08.
      'length'])
 
+# Only the length is used, so the reserved bytes are skipped.
+_unpack_db4_memo_length = struct.Struct('<4xL').unpack_from
+
 
 class VFPMemo(bytes):
     """Base class for VFP memo fields."""
@@ -68,6 +76,11 @@ VFP_TYPE_MAP: dict[int, type[VFPMemo]] = {
     0x2: ObjectMemo,
 }
 
+# VFP_TYPE_MAP as a tuple indexed by memo type, which is faster to look
+# up. Other types are binary memos.
+_VFP_TYPES = tuple(VFP_TYPE_MAP[memo_type]
+                   for memo_type in range(len(VFP_TYPE_MAP)))
+
 
 class MemoFile:
     """Base class for memo file handlers."""
@@ -85,18 +98,48 @@ class MemoFile:
     def _open(self) -> None:
         """Open the memo file for reading."""
         self.file = open(self.filename, 'rb')
-        # Shortcuts for speed
-        self._read = self.file.read
-        self._seek = self.file.seek
+        # Memos are sliced out of the mapped file.
+        self._mm = self._map()
 
     def _close(self) -> None:
         """Close the memo file."""
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
         self.file.close()
 
+    def _map(self) -> mmap.mmap | bytes:
+        """Memory map the memo file for reading.
+
+        An empty file can not be mapped and is returned as b''.
+        """
+        try:
+            mapped = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Cannot mmap an empty file.
+            return b''
+
+        # Memos are looked up by index in whatever order the records
+        # refer to them, so reading ahead is mostly wasted. Not
+        # available on all platforms.
+        if hasattr(mmap, 'MADV_RANDOM'):
+            mapped.madvise(mmap.MADV_RANDOM)
+
+        return mapped
+
     def __getitem__(self, index: int) -> bytes | None:
         """Get memo data at the specified index."""
         raise NotImplementedError
 
+    def get_many(self, indices: Iterable[int]) -> list[bytes | None]:
+        """Get memo data for several indices.
+
+        Each distinct index is fetched only once, even if it is
+        repeated. The memos are returned in the same order as indices.
+        """
+        indices = list(indices)
+        memos = {index: self[index] for index in sorted(set(indices))}
+        return [memos[index] for index in indices]
+
     def __enter__(self) -> MemoFile:
         return self
 
@@ -121,21 +164,83 @@ class VFPMemoFile(MemoFile):
     """Visual FoxPro memo file handler."""
 
     def _init(self) -> None:
-        self.header = VFPFileHeader.read(self.file)
+        self.header = VFPFileHeader.unpack_from(self._mm)
+        # Shortcut for speed
+        self._blocksize = self.header.blocksize
+        # Memos are created from a slice of this, so the data is only
+        # copied once, into the memo object.
+        self._view = memoryview(self._mm)
+
+    def _close(self) -> None:
+        # The view must be released before the file can be unmapped.
+        self._view.release()
+        super()._close()
 
     def __getitem__(self, index: int) -> VFPMemo | None:
         """Get a memo from the file."""
         if index <= 0:
             return None
 
-        self._seek(index * self.header.blocksize)
-        memo_header = VFPMemoHeader.read(self.file)
+        start = index * self._blocksize
+        # Unpacked as a plain tuple since the header is not returned.
+        memo_type, length = _unpack_vfp_memo_header(self._mm, start)
 
-        data = self._read(memo_header.length)
-        if len(data) != memo_header.length:
+        start += VFPMemoHeader.size
+        end = start + length
+        if end > len(self._mm):
             raise OSError('EOF reached while reading memo')
 
-        return VFP_TYPE_MAP.get(memo_header.type, BinaryMemo)(data)
+        if memo_type < len(_VFP_TYPES):
+            memo_class = _VFP_TYPES[memo_type]
+        else:
+            memo_class = BinaryMemo
+
+        # The slice is not kept since it would prevent closing the file.
+        return memo_class(self._view[start:end])
+
+    def scan_all(self) -> Iterator[tuple[int, Any]]:
+        """Iterate over all memos in the file.
+
+        Yields (index, memo header) for each memo, in file order. The
+        memos are found by following the chain of blocks from the file
+        header up to the next free block, without reading memo data.
+        """
+        mm = self._mm
+        blocksize = self._blocksize
+        if not blocksize:
+            return
+
+        # Memos start in the first block after the file header.
+        index = -(-VFPFileHeader.size // blocksize)
+        while index < self.header.nextblock:
+            memo_header = VFPMemoHeader.unpack_from(mm, index * blocksize)
+            yield index, memo_header
+            # The memo header is followed by the data, padded to a
+            # whole number of blocks.
+            size = VFPMemoHeader.size + memo_header.length
+            index += -(-size // blocksize)
+
+    def preload_range(self, start: int, stop: int) -> dict[int, VFPMemo]:
+        """Read all memos that start in blocks start to stop.
+
+        Returns a dict of memos by index. The memos are read in file
+        order, and the OS is asked to read the whole range up front.
+        """
+        blocksize = self._blocksize
+        if hasattr(mmap, 'MADV_WILLNEED') and stop > start:
+            # The offset must be a multiple of the page size.
+            offset = start * blocksize // mmap.PAGESIZE * mmap.PAGESIZE
+            end = min(stop * blocksize, len(self._mm))
+            if end > offset:
+                self._mm.madvise(mmap.MADV_WILLNEED, offset, end - offset)
+
+        memos = {}
+        for index, _ in self.scan_all():
+            if index >= stop:
+                break
+            elif index >= start:
+                memos[index] = self[index]
+        return memos
 
 
 class DB3MemoFile(MemoFile):
@@ -146,20 +251,16 @@ class DB3MemoFile(MemoFile):
         if index <= 0:
             return None
 
+        mm = self._mm
         block_size = 512
-        self._seek(index * block_size)
-        data = b''
-
-        while True:
-            newdata = self._read(block_size)
-            if not newdata:
-                return data
-            data += newdata
+        start = index * block_size
 
-            # Find end of memo marker
-            end_of_memo = data.find(b'\x1a')
-            if end_of_memo != -1:
-                return data[:end_of_memo]
+        # Find end of memo marker
+        end_of_memo = mm.find(b'\x1a', start)
+        if end_of_memo == -1:
+            return mm[start:]
+        else:
+            return mm[start:end_of_memo]
 
 
 class DB4MemoFile(MemoFile):
@@ -170,11 +271,20 @@ class DB4MemoFile(MemoFile):
         if index <= 0:
             return None
 
+        mm = self._mm
         block_size = 512
-        self._seek(index * block_size)
-        memo_header = DB4MemoHeader.read(self.file)
-        data = self._read(memo_header.length)
-        return data.split(b'\x1f', 1)[0]
+        start = index * block_size
+        length, = _unpack_db4_memo_length(mm, start)
+
+        start += DB4MemoHeader.size
+        end = start + length
+
+        # The memo may end early with a field terminator.
+        end_of_memo = mm.find(b'\x1f', start, end)
+        if end_of_memo != -1:
+            end = end_of_memo
+
+        return mm[start:end]
 
 
 def find_memofile(dbf_filename: str | Path) -> str | Path | None:
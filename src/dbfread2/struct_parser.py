@@ -5,12 +5,13 @@ The struct can be read from a file or a byte string.
 """
 
 import struct
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any, BinaryIO, ClassVar, TypeVar
 
 T = TypeVar('T', bound='StructBase')
 
-@dataclass
+@dataclass(slots=True)
 class StructBase:
     """Base class for all struct classes."""
     _names: ClassVar[list[str]]
@@ -31,11 +32,11 @@ def _make_struct_class(name: str, names: list[str]) -> type[StructBase]:
     Returns:
         A new dataclass type with the specified fields
     """
-    fields = [(name, Any) for name in names]
+    # Slots make instances smaller and faster to create.
     cls = dataclass(type(name, (StructBase,), {
         '__annotations__': {name: Any for name in names},
         '_names': names
-    }))
+    }), slots=True)
     return cls
 
 
@@ -54,6 +55,9 @@ class StructParser:
         self.struct: struct.Struct = struct.Struct(format)
         self.Class: type[StructBase] = _make_struct_class(name, names)
         self.size: int = self.struct.size
+        # Shortcuts for speed
+        self._unpack = self.struct.unpack
+        self._unpack_from = self.struct.unpack_from
 
     def unpack(self, data: bytes) -> StructBase:
         """Unpack struct from binary string and return a dataclass instance.
@@ -64,8 +68,8 @@ class StructParser:
         Returns:
             A dataclass instance containing the unpacked data
         """
-        items = zip(self.names, self.struct.unpack(data), strict=True)
-        return self.Class(**dict(items))
+        # Values are passed by position, in the same order as names.
+        return self.Class(*self._unpack(data))
 
     def read(self, file: BinaryIO) -> StructBase:
         """Read struct from a file-like object (implementing read()).
@@ -76,4 +80,30 @@ class StructParser:
         Returns:
             A dataclass instance containing the read data
         """
-        return self.unpack(file.read(self.struct.size))
+        return self.Class(*self._unpack(file.read(self.size)))
+
+    def unpack_from(self, buffer: Any, offset: int = 0) -> StructBase:
+        """Unpack struct from a buffer, starting at offset.
+
+        Args:
+            buffer: Bytes-like object containing the struct
+            offset: Position of the struct in the buffer
+
+        Returns:
+            A dataclass instance containing the unpacked data
+        """
+        return self.Class(*self._unpack_from(buffer, offset))
+
+    def iter_unpack(self, buffer: Any) -> Iterator[StructBase]:
+        """Unpack consecutive structs from a buffer.
+
+        Args:
+            buffer: Bytes-like object whose size is a multiple of
+                self.size
+
+        Returns:
+            Iterator of dataclass instances, one for each struct
+        """
+        make = self.Class
+        for values in self.struct.iter_unpack(buffer):
+            yield make(*values)
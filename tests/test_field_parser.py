@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from pytest import raises
 
-from dbfread2.field_parser import FieldParser
+from dbfread2.field_parser import FieldParser, InvalidValue
 
 
 class MockHeader:
@@ -57,10 +57,15 @@ def test_D():
 
     epoch = datetime.date(1970, 1, 1)
     assert parse(b'19700101') == epoch
+    assert parse(b'20241231') == datetime.date(2024, 12, 31)
+    assert parse(b'1970 1 1') == epoch
 
     with raises(ValueError):
         parse(b'NotIntgr')
 
+    with raises(ValueError):
+        parse(b'20230229')
+
 def test_F():
     parse = make_field_parser('F')
 
@@ -105,6 +110,13 @@ def test_L():
         with raises(ValueError):
             parse(char)
 
+    # Values as read from a file.
+    assert parse(b'T') is True
+    assert parse(b'n') is False
+    assert parse(b'\0') is None
+    with raises(ValueError):
+        parse(b'!')
+
 # This also tests B, G and P.
 def test_M():
     parse = make_field_parser('M', memofile=MockMemoFile({1: b'test'}))
@@ -142,6 +154,8 @@ def test_N():
     # In some files * is used for padding.
     assert parse(b'0.01**') == 0.01
     assert parse(b'******') is None
+    assert parse(b' *\0 12\0') == 12
+    assert parse(b'  1,5') == 1.5
 
     with raises(ValueError):
         parse(b'okasd')
@@ -181,3 +195,21 @@ def test_hex_field():
     field = MockField('?')
 
     parser.parse(field, b'test')
+
+def test_get_parsers():
+    fields = [MockField('C'), MockField('L')]
+
+    parsers = FieldParser(MockDBF()).get_parsers(fields)
+    assert parsers[0](fields[0], b'test  ') == 'test'
+    assert parsers[1](fields[1], b'T') is True
+
+    # An overridden parse() must be used for all fields.
+    class SafeFieldParser(FieldParser):
+        def parse(self, field, data):
+            try:
+                return FieldParser.parse(self, field, data)
+            except ValueError:
+                return InvalidValue(data)
+
+    parsers = SafeFieldParser(MockDBF()).get_parsers(fields)
+    assert parsers[1](fields[1], b'!') == InvalidValue(b'!')
@@ -1,6 +1,9 @@
-from dbfread2.ifiles import ifnmatch, ipat
+from pathlib import Path
+
+from dbfread2.ifiles import ifind, ifnmatch, ipat
 
 assert ipat('mixed') == '[Mm][Ii][Xx][Ee][Dd]'
+assert ipat('Ab_1é') == '[Aa][Bb]_1[Éé]'
 assert ifnmatch('test', 'test')
 assert ifnmatch('miXEdCaSe', 'mixedcase')
 assert not ifnmatch('CAMELCASE/CamelCase', 'CamelCase/UPPERCASE')
@@ -8,3 +11,15 @@ assert not ifnmatch('CAMELCASE/CamelCase', 'CamelCase/UPPERCASE')
 # Pattern with
 # assert ipat('[A]') == '[[Aa]]'
 
+
+def test_ifind():
+    # Results use the native path separator.
+    dbf = str(Path('tests/cases') / 'memotest.dbf')
+    fpt = str(Path('tests/cases') / 'memotest.FPT')
+
+    assert ifind('tests/cases/MEMOTEST.DBF') == dbf
+    assert ifind('tests/cases/memotest.dbf', ext='.fpt') == fpt
+    assert ifind('tests/cases/memotest', ext='.fpt') == fpt
+    assert ifind('./tests/cases/MEMOTEST.DBF') == dbf
+    assert ifind('tests/cases/*.fpt') == fpt
+    assert ifind('tests/missing/memotest.dbf') is None
@@ -1,6 +1,9 @@
+import struct
+
 from pytest import raises
 
 from dbfread2 import DBF, MissingMemoFileError
+from dbfread2.memo import VFPMemoFile, open_memofile
 
 
 def test_missing_memofile():
@@ -13,3 +16,72 @@ def test_missing_memofile():
     # Memo fields should be returned as None.
     record = next(iter(table))
     assert record['MEMO'] is None
+
+
+def test_vfp_scan_all():
+    with VFPMemoFile('tests/cases/memotest.FPT') as memofile:
+        memos = list(memofile.scan_all())
+
+        assert [index for index, _ in memos] == [1, 2, 3, 4]
+        assert memos[0][1].length == len(b'Alice memo')
+        assert memofile[1] == b'Alice memo'
+        assert memofile.preload_range(2, 4) == {2: b'Bob memo',
+                                                3: memofile[3]}
+
+
+def test_vfp_truncated_memo(tmp_path):
+    filename = tmp_path / 'test.fpt'
+    with open('tests/cases/memotest.FPT', 'rb') as infile:
+        # Header and the first few bytes of the first memo.
+        filename.write_bytes(infile.read(512 + 12))
+
+    with raises(OSError), VFPMemoFile(filename) as memofile:
+        memofile[1]
+
+
+def make_memofile(path, blocks):
+    """Write a memo file with 512 byte blocks, starting at block 1."""
+    data = b'\0' * 512
+    for block in blocks:
+        data += block.ljust(512, b'\0')
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_db3_memo(tmp_path):
+    long_memo = b'x' * 600
+    filename = make_memofile(tmp_path / 'test.dbt',
+                             [b'first\x1a\x1a', long_memo + b'\x1a'])
+
+    with open_memofile(filename, 0x83) as memofile:
+        assert memofile[0] is None
+        assert memofile[1] == b'first'
+        assert memofile[2] == long_memo
+        assert memofile.get_many([2, 0, 1, 2]) == [long_memo, None,
+                                                   b'first', long_memo]
+
+
+def test_db3_memo_without_end_marker(tmp_path):
+    filename = tmp_path / 'test.dbt'
+    filename.write_bytes(b'\0' * 512 + b'last')
+
+    with open_memofile(filename, 0x83) as memofile:
+        assert memofile[1] == b'last'
+        assert memofile[2] == b''
+
+    # An empty file can not be memory mapped.
+    filename.write_bytes(b'')
+    with open_memofile(filename, 0x83) as memofile:
+        assert memofile[1] == b''
+
+
+def test_db4_memo(tmp_path):
+    filename = make_memofile(
+        tmp_path / 'test.dbt',
+        [b'\xff\xff\x08\x08' + struct.pack('<L', 6) + b'first\x1f',
+         b'\xff\xff\x08\x08' + struct.pack('<L', 6) + b'second'])
+
+    with open_memofile(filename, 0x8b) as memofile:
+        assert memofile[0] is None
+        assert memofile[1] == b'first'
+        assert memofile[2] == b'second'
@@ -2,8 +2,10 @@
 Tests reading from database.
 """
 import datetime
+import struct
+from collections import namedtuple
 
-from pytest import fixture
+from pytest import fixture, raises
 
 from dbfread2 import DBF
 
@@ -44,3 +46,41 @@ def test_list(table, loaded_table):
 
     # This should not return old style table which was a subclass of list.
     assert not isinstance(table, list)
+
+def test_keep_raw():
+    table = DBF('tests/cases/memotest.dbf', keep_raw=True)
+
+    assert next(iter(table)) == {'NAME': b'Alice           ',
+                                 'BIRTHDATE': b'19870301',
+                                 'MEMO': b'\x01\x00\x00\x00'}
+
+def test_namedtuple_record_factory():
+    Record = namedtuple('Record', ['name', 'birthdate', 'memo'])
+    table = DBF('tests/cases/memotest.dbf', record_factory=Record)
+
+    assert list(table) == [Record(*record.values()) for record in records]
+
+def test_parallel_iter(table):
+    # With 5 workers each record is parsed in a separate process.
+    assert list(table.parallel_iter(workers=2)) == records
+    assert list(table.parallel_iter(workers=5)) == records
+
+    table.recfactory = namedtuple('Record', table.field_names)
+    assert list(table.parallel_iter(workers=2)) == [
+        table.recfactory(**record) for record in records]
+
+    with raises(ValueError):
+        table.parallel_iter(workers=0)
+
+def test_parallel_iter_repeated_names(tmp_path):
+    # Two character fields that are both named A.
+    filename = tmp_path / 'repeated.dbf'
+    filename.write_bytes(
+        struct.pack('<BBBBLHH20x', 0x03, 124, 1, 1, 1, 97, 6)
+        + struct.pack('<11scLBB14x', b'A', b'C', 0, 3, 0)
+        + struct.pack('<11scLBB14x', b'A', b'C', 0, 2, 0)
+        + b'\r' + b' abcde' + b'\x1a')
+    table = DBF(filename, record_factory=lambda items: items)
+
+    assert list(table) == [[('A', 'abc'), ('A', 'de')]]
+    assert list(table.parallel_iter(workers=2)) == list(table)
@@ -0,0 +1,31 @@
+import struct
+
+from pytest import raises
+
+from dbfread2.struct_parser import StructParser
+
+Point = StructParser('Point', '<hh', ['x', 'y'])
+
+
+def test_unpack():
+    point = Point.unpack(struct.pack('<hh', 1, -2))
+    assert (point.x, point.y) == (1, -2)
+    assert repr(point) == 'Point(x=1, y=-2)'
+
+    # The struct checks the size, so there is always one value per name.
+    with raises(struct.error):
+        Point.unpack(b'\0' * 3)
+    with raises(struct.error):
+        Point.unpack(b'\0' * 5)
+
+
+def test_unpack_from():
+    data = b'\0' + struct.pack('<hh', 3, 4)
+    point = Point.unpack_from(data, 1)
+    assert (point.x, point.y) == (3, 4)
+
+
+def test_iter_unpack():
+    data = struct.pack('<hhhh', 1, 2, 3, 4)
+    assert [(p.x, p.y) for p in Point.iter_unpack(data)] == [(1, 2), (3, 4)]
+
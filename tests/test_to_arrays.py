@@ -0,0 +1,119 @@
+"""
+Tests for reading columns into NumPy arrays.
+"""
+import datetime
+import struct
+
+from pytest import importorskip
+
+from dbfread2 import DBF, FieldParser
+
+np = importorskip('numpy')
+
+
+def make_dbf(path, fields, records):
+    """Write a minimal dBase III file.
+
+    fields is a list of (name, type, length, decimal_count) and records
+    a list of (separator, data) where data is the raw record content.
+    """
+    recordlen = 1 + sum(length for _, _, length, _ in fields)
+    headerlen = 32 + 32 * len(fields) + 1
+
+    data = struct.pack('<BBBBLHH20x', 0x03, 124, 1, 1, len(records),
+                       headerlen, recordlen)
+    for name, type_, length, decimal_count in fields:
+        data += struct.pack('<11scLBB14x', name, type_, 0, length,
+                            decimal_count)
+    data += b'\r'
+    for sep, record in records:
+        data += sep + record
+    data += b'\x1a'
+
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_memotest():
+    arrays = DBF('tests/cases/memotest.dbf').to_arrays()
+
+    assert list(arrays) == ['NAME', 'BIRTHDATE', 'MEMO']
+    assert arrays['NAME'].tolist() == ['Alice', 'Bob']
+    assert arrays['BIRTHDATE'].tolist() == [datetime.date(1987, 3, 1),
+                                            datetime.date(1980, 11, 12)]
+    assert arrays['MEMO'].tolist() == ['Alice memo', 'Bob memo']
+
+
+def test_numeric_columns(tmp_path):
+    fields = [(b'AGE', b'N', 3, 0),
+              (b'PRICE', b'N', 6, 2),
+              (b'RATIO', b'F', 5, 2),
+              (b'COUNT', b'I', 4, 0)]
+    records = [(b' ', b' 42  1.50 0.25' + struct.pack('<i', -1)),
+               (b'*', b'  1  2.00 1.00' + struct.pack('<i', 2)),
+               (b' ', b'  7      **** ' + struct.pack('<i', 3))]
+    table = DBF(make_dbf(tmp_path / 'numbers.dbf', fields, records))
+
+    arrays = table.to_arrays()
+
+    assert arrays['AGE'].dtype == np.int64
+    assert arrays['AGE'].tolist() == [42, 7]
+    assert arrays['PRICE'][0] == 1.5
+    assert np.isnan(arrays['PRICE'][1])
+    assert arrays['RATIO'][0] == 0.25
+    assert np.isnan(arrays['RATIO'][1])
+    assert arrays['COUNT'].tolist() == [-1, 3]
+
+    # Same values as when iterating over the table.
+    assert [record['AGE'] for record in table] == [42, 7]
+
+
+def test_custom_parser():
+    class ReversedFieldParser(FieldParser):
+        def parseC(self, field, data):
+            return data.rstrip(b' ').decode()[::-1]
+
+    table = DBF('tests/cases/memotest.dbf', parser_class=ReversedFieldParser)
+
+    assert table.to_arrays()['NAME'].tolist() == ['ecilA', 'boB']
+
+    class UpperFieldParser(FieldParser):
+        def decode_text(self, text):
+            return text.decode('latin1').upper()
+
+    table = DBF('tests/cases/memotest.dbf', parser_class=UpperFieldParser)
+
+    assert table.to_arrays()['NAME'].tolist() == ['ALICE', 'BOB']
+    assert [record['NAME'] for record in table] == ['ALICE', 'BOB']
+
+
+def test_parser_encoding(tmp_path):
+    class Latin1FieldParser(FieldParser):
+        def __init__(self, table, memofile=None):
+            super().__init__(table, memofile)
+            self.encoding = 'latin1'
+
+    fields = [(b'NAME', b'C', 4, 0)]
+    records = [(b' ', b'caf\xe9')]
+    table = DBF(make_dbf(tmp_path / 'latin1.dbf', fields, records),
+                parser_class=Latin1FieldParser)
+
+    assert [record['NAME'] for record in table] == ['caf\xe9']
+    assert table.to_arrays()['NAME'].tolist() == ['caf\xe9']
+
+
+def test_date_column(tmp_path):
+    fields = [(b'DATE', b'D', 8, 0)]
+    records = [(b' ', b'19870301'),
+               (b' ', b'        '),
+               (b' ', b'00000000'),
+               (b' ', b'20240229')]
+    table = DBF(make_dbf(tmp_path / 'dates.dbf', fields, records))
+
+    dates = table.to_arrays()['DATE']
+
+    assert dates.dtype == np.dtype('datetime64[D]')
+    assert dates[0] == np.datetime64('1987-03-01')
+    assert np.isnat(dates[1])
+    assert np.isnat(dates[2])
+    assert dates[3] == np.datetime64('2024-02-29')